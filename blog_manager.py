@@ -5,39 +5,163 @@ Blog Manager - Core business logic for managing blog posts
 import os
 import json
 from datetime import datetime
-from typing import List, Tuple, Optional, Dict, Any
+from typing import List, Tuple, Optional, Dict, Any, Callable, ItemsView
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+import heapq
+from operator import itemgetter
 import re
+import shutil
 
-from models import BlogPost
+try:
+    import orjson
+except ImportError:  # Optional speedup, fall back to the stdlib json module
+    orjson = None
+
+from models import BlogPost, PostSummary
 from storage import JSONStorage
 from utils import generate_post_id, sanitize_filename
 
+# str.translate tables for HTML export: one C-level pass per string
+_HTML_ESCAPES = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;'
+})
+_HTML_CONTENT_ESCAPES = str.maketrans({**_HTML_ESCAPES, ord('\n'): '<br>\n'})
+
 class BlogManager:
     """Main class for managing blog posts"""
     
     def __init__(self, data_dir: str = "./blog_data"):
         self.data_dir = data_dir
         self.storage = JSONStorage(data_dir)
+        self._posts_cache: Optional[Dict[str, BlogPost]] = None
+        self._cache_mtimes: Dict[str, int] = {}
+        self._export_filenames: Dict[Tuple[str, str, datetime, str], str] = {}
+        self._list_cache: Dict[tuple, List[Tuple[str, BlogPost]]] = {}
+        self._summary_cache: Dict[tuple, List[Tuple[str, PostSummary]]] = {}
+        self._version = 0
         self._ensure_data_directory()
     
     def _ensure_data_directory(self):
         """Ensure the data directory exists"""
-        if not os.path.exists(self.data_dir):
-            os.makedirs(self.data_dir)
+        os.makedirs(self.data_dir, exist_ok=True)
     
-    def create_post(self, post: BlogPost) -> str:
-        """Create a new blog post and return its ID"""
-        post_id = generate_post_id(post.title)
+    def _get_all_posts_cached(self) -> ItemsView[str, BlogPost]:
+        """Get all blog posts, only re-reading files modified since the last call"""
+        if self._posts_cache is None:
+            self._posts_cache = {}
+        
+        seen = set()
+        stale = {}
+        for entry in os.scandir(self.storage.posts_dir):
+            if not entry.name.endswith('.json'):
+                continue
+            post_id = entry.name[:-5]  # Remove .json extension
+            seen.add(post_id)
+            
+            mtime = entry.stat().st_mtime_ns
+            if self._cache_mtimes.get(post_id) != mtime or post_id not in self._posts_cache:
+                stale[post_id] = mtime
+        
+        self._reload_cached_posts(stale)
+        
+        # Evict posts whose files were removed
+        for post_id in [pid for pid in self._posts_cache if pid not in seen]:
+            self._evict_cached_post(post_id)
+        
+        # A live view rather than a copied list
+        return self._posts_cache.items()
+    
+    def _get_posts_cached(self, post_ids: List[str]) -> List[Tuple[str, BlogPost]]:
+        """Get specific blog posts, only re-reading files modified since they were cached"""
+        if self._posts_cache is None:
+            self._posts_cache = {}
+        
+        stale = {}
+        for post_id in post_ids:
+            try:
+                mtime = os.stat(self.storage.raw_path(post_id)).st_mtime_ns
+            except OSError:
+                self._evict_cached_post(post_id)
+                continue
+            
+            if self._cache_mtimes.get(post_id) != mtime or post_id not in self._posts_cache:
+                stale[post_id] = mtime
+        
+        self._reload_cached_posts(stale)
+        
+        return [(post_id, self._posts_cache[post_id]) for post_id in post_ids
+                if post_id in self._posts_cache]
+    
+    def _reload_cached_posts(self, stale: Dict[str, int]):
+        """Re-read new or modified post files into the cache, given their current mtimes"""
+        if not stale:
+            return
+        
+        # Read in parallel (every post on a cold cache)
+        loaded = dict(self.storage.load_posts(list(stale)))
+        for post_id, mtime in stale.items():
+            post = loaded.get(post_id)
+            if post:
+                self._posts_cache[post_id] = post
+                self._cache_mtimes[post_id] = mtime
+            else:
+                self._evict_cached_post(post_id)
+    
+    def _cache_post(self, post_id: str, post: BlogPost):
+        """Store a just-saved post in the cache slot for its file"""
+        if self._posts_cache is None:
+            return
+        
+        try:
+            mtime = os.stat(self.storage.raw_path(post_id)).st_mtime_ns
+        except OSError:
+            self._evict_cached_post(post_id)
+            return
         
-        # Ensure unique ID
+        self._posts_cache[post_id] = post
+        self._cache_mtimes[post_id] = mtime
+    
+    def _evict_cached_post(self, post_id: str):
+        """Drop a post from the cache"""
+        if self._posts_cache is not None:
+            self._posts_cache.pop(post_id, None)
+        self._cache_mtimes.pop(post_id, None)
+    
+    def _unique_post_id(self, original_id: str) -> str:
+        """Get an unused post ID, suffixing the smallest free counter -N if needed"""
+        id_pattern = re.compile(rf'^{re.escape(original_id)}(?:-([1-9]\d*))?\.json$')
+        
+        # One directory scan instead of probing each candidate ID in turn
+        counters = set()
+        for entry in os.scandir(self.storage.posts_dir):
+            if entry.name.startswith(original_id):
+                match = id_pattern.match(entry.name)
+                if match:
+                    counters.add(int(match.group(1) or 0))
+        
+        if 0 not in counters:
+            return original_id
+        
+        # A taken -N may be a real slug ending in a number ("Top 10"), not
+        # an earlier collision, so fill the first gap rather than going past it
         counter = 1
-        original_id = post_id
-        while self.storage.post_exists(post_id):
-            post_id = f"{original_id}-{counter}"
+        while counter in counters:
             counter += 1
         
-        self.storage.save_post(post_id, post)
+        return f"{original_id}-{counter}"
+    
+    def create_post(self, post: BlogPost) -> str:
+        """Create a new blog post and return its ID"""
+        post_id = self._unique_post_id(generate_post_id(post.title))
+        
+        if self.storage.save_post(post_id, post):
+            self._cache_post(post_id, post)
+        self._version += 1
         return post_id
     
     def get_post(self, post_id: str) -> Optional[BlogPost]:
@@ -49,135 +173,206 @@ class BlogManager:
         if not self.storage.post_exists(post_id):
             return False
         
-        self.storage.save_post(post_id, post)
+        if self.storage.save_post(post_id, post):
+            self._cache_post(post_id, post)
+        self._version += 1
         return True
     
     def delete_post(self, post_id: str) -> bool:
         """Delete a blog post"""
-        return self.storage.delete_post(post_id)
+        deleted = self.storage.delete_post(post_id)
+        self._evict_cached_post(post_id)
+        self._version += 1
+        return deleted
+    
+    def data_version(self) -> Tuple[int, Optional[int], Optional[int]]:
+        """Get a token that changes whenever posts change here or their files change on disk"""
+        # Post files rewritten in place elsewhere don't touch either mtime;
+        # refresh() picks those up
+        return (self._version, self.storage.index_mtime(), self.storage.posts_mtime())
+    
+    def refresh(self):
+        """Forget cached listings, so the next ones re-read the posts from disk"""
+        self._list_cache = {}
+        self._summary_cache = {}
+        self._version += 1
     
     def list_posts(self, limit: int = 10, tag: Optional[str] = None, 
                    author: Optional[str] = None) -> List[Tuple[str, BlogPost]]:
         """List blog posts with optional filtering"""
-        all_posts = self.storage.load_all_posts()
+        return self._cached('_list_cache', self._newest_posts, limit, tag, author)
+    
+    def list_post_summaries(self, limit: int = 10, tag: Optional[str] = None,
+                            author: Optional[str] = None) -> List[Tuple[str, PostSummary]]:
+        """List summaries of blog posts, filtered like list_posts, without reading their content"""
+        return self._cached('_summary_cache', self._newest_summaries, limit, tag, author)
+    
+    def _cached(self, cache_name: str, build: Callable[..., list], *args) -> list:
+        """Get a copy of build(*args) from the named cache, rebuilding it if the data changed"""
+        # Results are reused until a post changes here or on disk
+        version = self.data_version()
+        key = args + (version,)
         
-        # Apply filters
-        filtered_posts = []
-        for post_id, post in all_posts:
-            if tag and tag not in post.tags:
-                continue
-            if author and post.author.lower() != author.lower():
-                continue
-            filtered_posts.append((post_id, post))
+        cache = getattr(self, cache_name)
+        result = cache.get(key)
+        if result is None:
+            result = build(*args)
+            
+            # Only results for the current state are worth keeping
+            cache = {k: v for k, v in cache.items() if k[-1] == version}
+            cache[key] = result
+            setattr(self, cache_name, cache)
         
-        # Sort by creation date (newest first)
-        filtered_posts.sort(key=lambda x: x[1].created_at, reverse=True)
+        return list(result)
+    
+    def _newest_posts(self, limit: int, tag: Optional[str],
+                      author: Optional[str]) -> List[Tuple[str, BlogPost]]:
+        """Get the newest posts matching the filters"""
+        # Filter and sort on the index headers, so only the posts being
+        # returned have to be read and parsed
+        newest = self._newest_headers(limit, tag, author)
+        return self._get_posts_cached([post_id for post_id, _ in newest])
+    
+    def _newest_summaries(self, limit: int, tag: Optional[str],
+                          author: Optional[str]) -> List[Tuple[str, PostSummary]]:
+        """Get summaries of the newest posts matching the filters"""
+        return [(post_id, PostSummary.from_dict(header))
+                for post_id, header in self._newest_headers(limit, tag, author)]
+    
+    def _newest_headers(self, limit: int, tag: Optional[str],
+                        author: Optional[str]) -> List[Tuple[str, dict]]:
+        """Get the index headers of the newest posts matching the filters"""
+        headers = self.storage.iter_post_headers()
         
-        # Apply limit
-        return filtered_posts[:limit]
+        # Hoist the filter arguments out of the loop
+        tag_filter = tag or None
+        author_lower = author.lower() if author else None
+        
+        # Apply filters lazily
+        filtered_headers = (
+            (post_id, header) for post_id, header in headers
+            if (tag_filter is None or tag_filter in header['tags'])
+            and (author_lower is None or header['author'].lower() == author_lower)
+        )
+        
+        # Newest first; nlargest avoids sorting every post when limit is small.
+        # ISO 8601 timestamps sort chronologically as plain strings.
+        return heapq.nlargest(limit, filtered_headers, key=lambda x: x[1]['created_at'])
     
-    def search_posts(self, query: str) -> List[Tuple[str, BlogPost]]:
-        """Search for blog posts by title or content"""
-        all_posts = self.storage.load_all_posts()
+    def search_posts(self, query: str, limit: Optional[int] = None) -> List[Tuple[str, BlogPost]]:
+        """Search for blog posts by title or content, optionally keeping only the top matches"""
+        all_posts = self._get_all_posts_cached()
         results = []
         
         query_lower = query.lower()
         
         for post_id, post in all_posts:
-            # Search in title and content
-            if (query_lower in post.title.lower() or 
-                query_lower in post.content.lower() or
-                any(query_lower in tag.lower() for tag in post.tags)):
-                results.append((post_id, post))
-        
-        # Sort by relevance (title matches first, then content matches)
-        def relevance_score(item):
-            post_id, post = item
-            score = 0
-            if query_lower in post.title.lower():
-                score += 10
-            if query_lower in post.content.lower():
-                score += 5
-            if any(query_lower in tag.lower() for tag in post.tags):
-                score += 3
-            return score
-        
-        results.sort(key=relevance_score, reverse=True)
-        return results
+            # Lowercase each field once and reuse it for both matching and scoring.
+            # A case-sensitive hit on the original content skips lowercasing it.
+            title_match = query_lower in post.title.lower()
+            content_match = (query_lower in post.content or
+                             query_lower in post.content.lower())
+            tag_match = any(query_lower in tag.lower() for tag in post.tags)
+            
+            if not (title_match or content_match or tag_match):
+                continue
+            
+            # Relevance: title matches first, then content, then tags
+            score = 10 * title_match + 5 * content_match + 3 * tag_match
+            results.append((score, post_id, post))
+        
+        if limit is None:
+            results.sort(key=itemgetter(0), reverse=True)
+        else:
+            results = heapq.nlargest(limit, results, key=itemgetter(0))
+        
+        return [(post_id, post) for _, post_id, post in results]
     
     def export_posts(self, output_dir: str, format: str = 'markdown') -> List[str]:
         """Export all blog posts to static files"""
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
+        os.makedirs(output_dir, exist_ok=True)
         
-        all_posts = self.storage.load_all_posts()
-        exported_files = []
+        all_posts = self._get_all_posts_cached()
+        
+        if format == 'markdown':
+            exporter = self._export_as_markdown
+        elif format == 'html':
+            exporter = self._export_as_html
+        elif format == 'json':
+            # Stored posts already use the export layout. orjson re-encodes the
+            # cached posts faster than copying their files; without it, copy
+            # the files rather than going through the stdlib encoder.
+            exporter = self._export_as_json if orjson is not None else None
+        else:
+            raise ValueError(f"Unsupported export format: {format}")
         
+        # Build the jobs up front, then overlap the independent file writes.
+        # Posts mapping to the same filename keep the last one, as a serial
+        # export would, instead of racing on the same file.
+        exported_files = []
+        jobs = {}
         for post_id, post in all_posts:
             filename = self._generate_export_filename(post_id, post, format)
-            filepath = os.path.join(output_dir, filename)
-            
-            if format == 'markdown':
-                content = self._export_as_markdown(post)
-            elif format == 'html':
-                content = self._export_as_html(post)
-            elif format == 'json':
-                content = self._export_as_json(post)
-            else:
-                raise ValueError(f"Unsupported export format: {format}")
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
-            
             exported_files.append(filename)
+            if exporter is None:
+                jobs[os.path.join(output_dir, filename)] = self.storage.raw_path(post_id)
+            else:
+                jobs[os.path.join(output_dir, filename)] = exporter(post)
+        
+        if jobs:
+            job = _copy_file if exporter is None else _write_file
+            max_workers = min(32, (os.cpu_count() or 1) * 4, len(jobs))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # Consume the results so write errors are raised here
+                for _ in executor.map(job, jobs.keys(), jobs.values()):
+                    pass
         
         return exported_files
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get blog statistics"""
-        all_posts = self.storage.load_all_posts()
-        
-        if not all_posts:
-            return {
-                'total_posts': 0,
-                'total_authors': 0,
-                'total_tags': 0,
-                'most_active_author': 'None',
-                'most_used_tags': [],
-                'avg_post_length': 0
-            }
-        
-        authors = [post.author for _, post in all_posts]
-        all_tags = []
+        # Summaries come from the index, so no post content has to be read
+        all_posts = self.storage.load_all_summaries()
+        
+        # Single pass: the counters also provide the unique author/tag counts,
+        # and an empty blog falls through to the zero/'None' defaults below
+        author_counter = Counter()
+        tag_counter = Counter()
+        total_posts = 0
         total_content_length = 0
         
         for _, post in all_posts:
-            all_tags.extend(post.tags)
-            total_content_length += len(post.content)
-        
-        author_counter = Counter(authors)
-        tag_counter = Counter(all_tags)
+            total_posts += 1
+            author_counter[post.author] += 1
+            tag_counter.update(post.tags)
+            total_content_length += post.content_length
         
         return {
-            'total_posts': len(all_posts),
-            'total_authors': len(set(authors)),
-            'total_tags': len(set(all_tags)),
-            'most_active_author': author_counter.most_common(1)[0][0] if author_counter else 'None',
+            'total_posts': total_posts,
+            'total_authors': len(author_counter),
+            'total_tags': len(tag_counter),
+            'most_active_author': max(author_counter, key=author_counter.get, default='None'),
             'most_used_tags': [tag for tag, _ in tag_counter.most_common(10)],
-            'avg_post_length': total_content_length // len(all_posts) if all_posts else 0
+            'avg_post_length': total_content_length // total_posts if total_posts else 0
         }
     
     def _generate_export_filename(self, post_id: str, post: BlogPost, format: str) -> str:
         """Generate filename for exported post"""
-        safe_title = sanitize_filename(post.title)
-        date_str = post.created_at.strftime('%Y-%m-%d')
-        extension = {'markdown': 'md', 'html': 'html', 'json': 'json'}[format]
+        key = (post_id, post.title, post.created_at, format)
+        filename = self._export_filenames.get(key)
+        if filename is None:
+            safe_title = sanitize_filename(post.title)
+            date_str = post.created_at.isoformat()[:10]  # YYYY-MM-DD
+            extension = {'markdown': 'md', 'html': 'html', 'json': 'json'}[format]
+            
+            filename = f"{date_str}-{safe_title}.{extension}"
+            self._export_filenames[key] = filename
         
-        return f"{date_str}-{safe_title}.{extension}"
+        return filename
     
     def _export_as_markdown(self, post: BlogPost) -> str:
         """Export post as markdown"""
-        tags_str = ", ".join(post.tags) if post.tags else "None"
+        tags_str, created_str, updated_str = _display_fields(post)
         
         content = f"""---
 title: {post.title}
@@ -191,8 +386,8 @@ updated: {post.updated_at.isoformat() if post.updated_at else 'Never'}
 
 **Author:** {post.author}  
 **Tags:** {tags_str}  
-**Created:** {post.created_at.strftime('%Y-%m-%d %H:%M:%S')}  
-**Updated:** {post.updated_at.strftime('%Y-%m-%d %H:%M:%S') if post.updated_at else 'Never'}
+**Created:** {created_str}  
+**Updated:** {updated_str}
 
 ---
 
@@ -202,17 +397,20 @@ updated: {post.updated_at.isoformat() if post.updated_at else 'Never'}
     
     def _export_as_html(self, post: BlogPost) -> str:
         """Export post as HTML"""
-        tags_str = ", ".join(post.tags) if post.tags else "None"
+        tags_str, created_str, updated_str = _display_fields(post)
         
-        # Simple markdown-like formatting
-        content_html = post.content.replace('\n', '<br>\n')
+        # Escape user text; the content also gets its line breaks in the same pass
+        title_html = post.title.translate(_HTML_ESCAPES)
+        author_html = post.author.translate(_HTML_ESCAPES)
+        tags_html = tags_str.translate(_HTML_ESCAPES)
+        content_html = post.content.translate(_HTML_CONTENT_ESCAPES)
         
         html = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{post.title}</title>
+    <title>{title_html}</title>
     <style>
         body {{ font-family: Arial, sans-serif; max-width: 800px; margin: 0 auto; padding: 20px; }}
         .meta {{ color: #666; border-bottom: 1px solid #eee; padding-bottom: 10px; margin-bottom: 20px; }}
@@ -220,12 +418,12 @@ updated: {post.updated_at.isoformat() if post.updated_at else 'Never'}
     </style>
 </head>
 <body>
-    <h1>{post.title}</h1>
+    <h1>{title_html}</h1>
     <div class="meta">
-        <p><strong>Author:</strong> {post.author}</p>
-        <p><strong>Tags:</strong> {tags_str}</p>
-        <p><strong>Created:</strong> {post.created_at.strftime('%Y-%m-%d %H:%M:%S')}</p>
-        <p><strong>Updated:</strong> {post.updated_at.strftime('%Y-%m-%d %H:%M:%S') if post.updated_at else 'Never'}</p>
+        <p><strong>Author:</strong> {author_html}</p>
+        <p><strong>Tags:</strong> {tags_html}</p>
+        <p><strong>Created:</strong> {created_str}</p>
+        <p><strong>Updated:</strong> {updated_str}</p>
     </div>
     <div class="content">
         {content_html}
@@ -236,13 +434,37 @@ updated: {post.updated_at.isoformat() if post.updated_at else 'Never'}
     
     def _export_as_json(self, post: BlogPost) -> str:
         """Export post as JSON"""
-        post_dict = {
-            'title': post.title,
-            'content': post.content,
-            'author': post.author,
-            'tags': post.tags,
-            'created_at': post.created_at.isoformat(),
-            'updated_at': post.updated_at.isoformat() if post.updated_at else None
-        }
+        # Datetimes are left for the encoder to serialize as ISO 8601
+        post_dict = post.to_dict(serialize_dates=False)
         
-        return json.dumps(post_dict, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            return orjson.dumps(post_dict, option=orjson.OPT_INDENT_2).decode('utf-8')
+        
+        return json.dumps(post_dict, indent=2, ensure_ascii=False, default=datetime.isoformat)
+
+
+def _display_fields(post: BlogPost) -> Tuple[str, str, str]:
+    """Get the tags, created and updated strings shown in exported posts"""
+    tags_str = ", ".join(post.tags) if post.tags else "None"
+    created_str = _format_display_date(post.created_at)
+    updated_str = _format_display_date(post.updated_at) if post.updated_at else "Never"
+    
+    return tags_str, created_str, updated_str
+
+
+def _format_display_date(date_obj: datetime) -> str:
+    """Format a datetime as YYYY-MM-DD HH:MM:SS"""
+    # Same output as strftime('%Y-%m-%d %H:%M:%S') without parsing a format string
+    return date_obj.isoformat(' ', 'seconds')[:19]
+
+
+def _write_file(path: str, content: str):
+    """Write text content to a file"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+
+def _copy_file(path: str, source: str):
+    """Copy a file to path (shutil uses os.sendfile where available)"""
+    shutil.copyfile(source, path)
+
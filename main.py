@@ -4,23 +4,39 @@ Terminal-based Blog Management Application
 Main entry point for the CLI interface
 """
 
+import sys
+import json
 import click
 from rich.console import Console
 from rich.table import Table
 from rich.prompt import Prompt, Confirm
 from rich.panel import Panel
-from rich.layout import Layout
-from rich.columns import Columns
-from rich.tree import Tree
+from rich.text import Text
 from datetime import datetime
-import time
+from typing import TYPE_CHECKING
+import functools
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, fall back to the stdlib json module
+    orjson = None
 
-from blog_manager import BlogManager
 from models import BlogPost
 from utils import validate_tags, format_date, truncate_text
 
+if TYPE_CHECKING:
+    from blog_manager import BlogManager
+
 console = Console()
-blog_manager = BlogManager()
+
+
+@functools.lru_cache(maxsize=1)
+def get_manager() -> 'BlogManager':
+    """Get the shared BlogManager, creating it on first use"""
+    # Imported here so --help and --version never load the storage stack
+    from blog_manager import BlogManager
+
+    return BlogManager()
 
 
 @click.group()
@@ -40,7 +56,10 @@ def cli():
               help='Content of the blog post (use editor if not provided)')
 @click.option('--tags', help='Comma-separated tags for the post')
 @click.option('--author', help='Author name')
-def create(title, content, tags, author):
+@click.option('--no-gui',
+              is_flag=True,
+              help="Don't offer to open the GUI after creating the post")
+def create(title, content, tags, author, no_gui):
     """Create a new blog post"""
     try:
         # Get content from editor if not provided
@@ -61,7 +80,7 @@ def create(title, content, tags, author):
                         tags=tag_list,
                         author=author or "Anonymous")
 
-        post_id = blog_manager.create_post(post)
+        post_id = get_manager().create_post(post)
 
         console.print(
             f"[green]✓ Blog post created successfully with ID: {post_id}[/green]"
@@ -70,6 +89,10 @@ def create(title, content, tags, author):
         # Display the created post
         display_post_summary(post, post_id)
 
+        # Scripts and pipes have nobody to answer the GUI prompt
+        if no_gui or not (sys.stdin.isatty() and sys.stdout.isatty()):
+            return
+
         # Ask if user wants to view in GUI
         try:
             if Confirm.ask("View all posts in GUI interface?", default=True):
@@ -88,7 +111,7 @@ def create(title, content, tags, author):
 def edit(post_id):
     """Edit an existing blog post"""
     try:
-        post = blog_manager.get_post(post_id)
+        post = get_manager().get_post(post_id)
         if not post:
             console.print(
                 f"[red]Error: Post with ID '{post_id}' not found[/red]")
@@ -96,31 +119,23 @@ def edit(post_id):
 
         console.print(f"[blue]Editing post: {post.title}[/blue]")
 
-        # Edit title
-        new_title = Prompt.ask("New title", default=post.title)
-
-        # Edit content
-        new_content = click.edit(post.content)
-        if new_content is None:
-            new_content = post.content
-
-        # Edit tags
-        current_tags = ", ".join(post.tags)
-        new_tags_input = Prompt.ask("Tags (comma-separated)",
-                                    default=current_tags)
-        new_tags = validate_tags(new_tags_input) if new_tags_input else []
+        # Edit every field in a single editor session
+        edited = click.edit(format_edit_document(post), extension='.md')
+        if edited is None:
+            console.print("[yellow]No changes made[/yellow]")
+            return
 
-        # Edit author
-        new_author = Prompt.ask("Author", default=post.author)
+        fields, new_content = parse_edit_document(edited)
+        new_tags_input = fields.get('tags', ", ".join(post.tags))
 
         # Update the post
-        post.title = new_title
+        post.title = fields.get('title') or post.title
         post.content = new_content.strip()
-        post.tags = new_tags
-        post.author = new_author
+        post.tags = validate_tags(new_tags_input) if new_tags_input else []
+        post.author = fields.get('author') or post.author
         post.updated_at = datetime.now()
 
-        blog_manager.update_post(post_id, post)
+        get_manager().update_post(post_id, post)
 
         console.print(
             f"[green]✓ Post '{post_id}' updated successfully[/green]")
@@ -134,7 +149,7 @@ def edit(post_id):
 def view(post_id):
     """View a specific blog post"""
     try:
-        post = blog_manager.get_post(post_id)
+        post = get_manager().get_post(post_id)
         if not post:
             console.print(
                 f"[red]Error: Post with ID '{post_id}' not found[/red]")
@@ -150,10 +165,19 @@ def view(post_id):
 @click.option('--limit', default=10, help='Number of posts to display')
 @click.option('--tag', help='Filter by tag')
 @click.option('--author', help='Filter by author')
-def list(limit, tag, author):
+@click.option('--format',
+              type=click.Choice(['table', 'json']),
+              default='table',
+              help='Output format')
+def list(limit, tag, author, format):
     """List all blog posts"""
     try:
-        posts = blog_manager.list_posts(limit=limit, tag=tag, author=author)
+        posts = get_manager().list_posts(limit=limit, tag=tag, author=author)
+
+        if format == 'json':
+            echo_json([{'id': post_id, **post.to_dict(serialize_dates=False)}
+                       for post_id, post in posts])
+            return
 
         if not posts:
             console.print("[yellow]No blog posts found[/yellow]")
@@ -167,12 +191,13 @@ def list(limit, tag, author):
         table.add_column("Created", style="yellow")
         table.add_column("Updated", style="yellow")
 
+        now = datetime.now()
         for post_id, post in posts:
             tags_str = ", ".join(post.tags) if post.tags else "None"
             table.add_row(
                 post_id, truncate_text(post.title, 30), post.author,
-                truncate_text(tags_str, 20), format_date(post.created_at),
-                format_date(post.updated_at) if post.updated_at else "Never")
+                truncate_text(tags_str, 20), format_date(post.created_at, now=now),
+                format_date(post.updated_at, now=now) if post.updated_at else "Never")
 
         console.print(table)
 
@@ -185,7 +210,7 @@ def list(limit, tag, author):
 def search(query):
     """Search blog posts by title or content"""
     try:
-        results = blog_manager.search_posts(query)
+        results = get_manager().search_posts(query)
 
         if not results:
             console.print(
@@ -208,7 +233,7 @@ def search(query):
 def delete(post_id):
     """Delete a blog post"""
     try:
-        post = blog_manager.get_post(post_id)
+        post = get_manager().get_post(post_id)
         if not post:
             console.print(
                 f"[red]Error: Post with ID '{post_id}' not found[/red]")
@@ -217,7 +242,7 @@ def delete(post_id):
         console.print(f"[yellow]Post to delete: {post.title}[/yellow]")
 
         if Confirm.ask("Are you sure you want to delete this post?"):
-            blog_manager.delete_post(post_id)
+            get_manager().delete_post(post_id)
             console.print(
                 f"[green]✓ Post '{post_id}' deleted successfully[/green]")
         else:
@@ -238,7 +263,7 @@ def delete(post_id):
 def export(output_dir, format):
     """Export all blog posts to static files"""
     try:
-        exported_files = blog_manager.export_posts(output_dir, format)
+        exported_files = get_manager().export_posts(output_dir, format)
 
         if not exported_files:
             console.print("[yellow]No posts to export[/yellow]")
@@ -256,10 +281,18 @@ def export(output_dir, format):
 
 
 @cli.command()
-def stats():
+@click.option('--format',
+              type=click.Choice(['table', 'json']),
+              default='table',
+              help='Output format')
+def stats(format):
     """Show blog statistics"""
     try:
-        stats = blog_manager.get_statistics()
+        stats = get_manager().get_statistics()
+
+        if format == 'json':
+            echo_json(stats)
+            return
 
         panel_content = f"""
 [bold blue]Blog Statistics[/bold blue]
@@ -285,20 +318,68 @@ def gui():
     display_blog_gui()
 
 
+def format_edit_document(post):
+    """Render a post's editable fields as a front-matter document for $EDITOR"""
+    return (f"title: {post.title}\n"
+            f"author: {post.author}\n"
+            f"tags: {', '.join(post.tags)}\n"
+            f"---\n"
+            f"{post.content}")
+
+
+def parse_edit_document(text):
+    """Split an edited front-matter document into its fields and content"""
+    header, separator, content = text.partition('\n---\n')
+    if not separator:
+        raise ValueError("missing the '---' line between the fields and the content")
+
+    fields = {}
+    for line in header.splitlines():
+        key, colon, value = line.partition(':')
+        if colon:
+            fields[key.strip().lower()] = value.strip()
+
+    return fields, content
+
+
+def echo_json(data):
+    """Write data to stdout as indented JSON, bypassing Rich"""
+    if orjson is not None:
+        click.echo(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        click.echo(json.dumps(data, indent=2, ensure_ascii=False,
+                              default=datetime.isoformat))
+
+
+def field_line(*fields):
+    """Build a Text line of blue-labelled fields separated by ' | '"""
+    line = Text()
+    for i, (label, value) in enumerate(fields):
+        if i:
+            line.append(" | ")
+        line.append(label, style="blue")
+        line.append(f" {value}")
+    return line
+
+
 def display_post_summary(post, post_id):
     """Display a summary of a blog post"""
     tags_str = ", ".join(post.tags) if post.tags else "None"
-
-    panel_content = f"""
-[bold magenta]{post.title}[/bold magenta]
-[blue]ID:[/blue] {post_id}
-[blue]Author:[/blue] {post.author}
-[blue]Tags:[/blue] {tags_str}
-[blue]Created:[/blue] {format_date(post.created_at)}
-[blue]Updated:[/blue] {format_date(post.updated_at) if post.updated_at else "Never"}
-
-[dim]{truncate_text(post.content, 200)}[/dim]
-    """
+    updated_str = format_date(post.updated_at) if post.updated_at else "Never"
+
+    # Styled Text is built directly, so post fields skip the markup parser
+    panel_content = Text("\n").join([
+        Text(),
+        Text(post.title, style="bold magenta"),
+        field_line(("ID:", post_id)),
+        field_line(("Author:", post.author)),
+        field_line(("Tags:", tags_str)),
+        field_line(("Created:", format_date(post.created_at))),
+        field_line(("Updated:", updated_str)),
+        Text(),
+        Text(truncate_text(post.content, 200), style="dim"),
+        Text(),
+    ])
 
     console.print(Panel(panel_content, border_style="green"))
 
@@ -306,13 +387,16 @@ def display_post_summary(post, post_id):
 def display_full_post(post, post_id):
     """Display a full blog post"""
     tags_str = ", ".join(post.tags) if post.tags else "None"
+    updated_str = format_date(post.updated_at) if post.updated_at else "Never"
 
     # Header
-    header = f"""
-[bold magenta]{post.title}[/bold magenta]
-[blue]ID:[/blue] {post_id} | [blue]Author:[/blue] {post.author} | [blue]Tags:[/blue] {tags_str}
-[blue]Created:[/blue] {format_date(post.created_at)} | [blue]Updated:[/blue] {format_date(post.updated_at) if post.updated_at else "Never"}
-    """
+    header = Text("\n").join([
+        Text(),
+        Text(post.title, style="bold magenta"),
+        field_line(("ID:", post_id), ("Author:", post.author), ("Tags:", tags_str)),
+        field_line(("Created:", format_date(post.created_at)), ("Updated:", updated_str)),
+        Text(),
+    ])
 
     console.print(Panel(header, border_style="blue"))
 
@@ -322,76 +406,36 @@ def display_full_post(post, post_id):
     console.print("\n" + "=" * 50 + "\n")
 
 
-def display_blog_gui():
-    """Display an interactive GUI interface for viewing blog posts"""
-    console.clear()
-
-    # Get all posts
-    posts = blog_manager.list_posts(limit=50)
-
-    if not posts:
-        console.print(
-            Panel(
-                "[yellow]No blog posts found. Create your first post with:[/yellow]\n[cyan]python main.py create[/cyan]",
-                title="🔍 Empty Blog",
-                border_style="yellow"))
-        return
-
-    # Create header
-    header = Panel(
-        "[bold blue]🌟 Blog Management System - GUI Interface 🌟[/bold blue]\n" +
-        f"[dim]Total Posts: {len(posts)} | Press Ctrl+C to exit[/dim]",
-        border_style="blue")
+# Printed in one call so each menu render goes through Rich once
+GUI_MENU = "\n".join([
+    "\n[bold cyan]Choose an option:[/bold cyan]",
+    "[cyan]1.[/cyan] View a specific post",
+    "[cyan]2.[/cyan] Create a new post",
+    "[cyan]3.[/cyan] Search posts",
+    "[cyan]4.[/cyan] Show statistics",
+    "[cyan]5.[/cyan] Refresh GUI",
+    "[cyan]6.[/cyan] List all posts (table view)",
+    "[cyan]7.[/cyan] Exit",
+])
 
-    console.print(header)
-    console.print()
 
-    # Show animated loading
-    with console.status("[bold green]Loading your blog posts...",
-                        spinner="dots"):
-        time.sleep(1)
+# The most recently drawn GUI layout, keyed on what it was built from
+_gui_layout_cache = {}
 
-    # Create layout
-    layout = Layout()
-    layout.split_column(Layout(name="header", size=3), Layout(name="body"),
-                        Layout(name="footer", size=3))
-
-    # Split body into sidebar and main content
-    layout["body"].split_row(Layout(name="sidebar", minimum_size=30),
-                             Layout(name="main", ratio=2))
-
-    # Create sidebar with post list
-    sidebar_content = create_sidebar_content(posts)
-    layout["sidebar"].update(sidebar_content)
-
-    # Create main content area
-    main_content = create_main_content(posts)
-    layout["main"].update(main_content)
-
-    # Create footer
-    footer_content = Panel(
-        "[bold cyan]Navigation:[/bold cyan] Use [yellow]'python main.py view <post-id>'[/yellow] to read full posts | "
-        + "[green]'python main.py create'[/green] to add new posts",
-        border_style="cyan")
-    layout["footer"].update(footer_content)
 
-    # Display the layout
-    console.print(layout)
-
-    # Interactive menu loop
-    console.print("\n[bold green]🎛️  Interactive Menu:[/bold green]")
-    console.print("[dim]Press Ctrl+C to exit anytime[/dim]")
+def display_blog_gui():
+    """Display an interactive GUI interface for viewing blog posts"""
+    # Menu actions set redraw instead of recursing back into this function
+    redraw = True
 
     while True:
+        if redraw:
+            if not draw_blog_gui():
+                return
+            redraw = False
+
         try:
-            console.print("\n[bold cyan]Choose an option:[/bold cyan]")
-            console.print("[cyan]1.[/cyan] View a specific post")
-            console.print("[cyan]2.[/cyan] Create a new post")
-            console.print("[cyan]3.[/cyan] Search posts")
-            console.print("[cyan]4.[/cyan] Show statistics")
-            console.print("[cyan]5.[/cyan] Refresh GUI")
-            console.print("[cyan]6.[/cyan] List all posts (table view)")
-            console.print("[cyan]7.[/cyan] Exit")
+            console.print(GUI_MENU)
 
             choice = Prompt.ask("[yellow]Enter your choice (1-7)[/yellow]",
                                 choices=["1", "2", "3", "4", "5", "6", "7"])
@@ -399,14 +443,13 @@ def display_blog_gui():
             if choice == "1":
                 # View specific post
                 post_id = Prompt.ask("[blue]Enter post ID to view[/blue]")
-                post = blog_manager.get_post(post_id)
+                post = get_manager().get_post(post_id)
                 if post:
                     console.clear()
                     display_full_post(post, post_id)
                     Prompt.ask("[dim]Press Enter to return to GUI...[/dim]",
                                default="")
-                    console.clear()
-                    return display_blog_gui()  # Refresh GUI
+                    redraw = True
                 else:
                     console.print(f"[red]Post '{post_id}' not found[/red]")
 
@@ -430,7 +473,7 @@ def display_blog_gui():
                                     tags=tag_list,
                                     author=author)
 
-                    post_id = blog_manager.create_post(post)
+                    post_id = get_manager().create_post(post)
                     console.print(
                         f"[green]✓ Blog post created successfully with ID: {post_id}[/green]"
                     )
@@ -438,15 +481,14 @@ def display_blog_gui():
 
                     Prompt.ask("[dim]Press Enter to return to GUI...[/dim]",
                                default="")
-                    console.clear()
-                    return display_blog_gui()  # Refresh GUI
+                    redraw = True
                 else:
                     console.print("[red]No content provided[/red]")
 
             elif choice == "3":
                 # Search posts
                 query = Prompt.ask("[blue]Enter search term[/blue]")
-                results = blog_manager.search_posts(query)
+                results = get_manager().search_posts(query)
                 console.clear()
 
                 if results:
@@ -480,28 +522,28 @@ def display_blog_gui():
                     Prompt.ask("[dim]Press Enter to return to GUI...[/dim]",
                                default="")
 
-                console.clear()
-                return display_blog_gui()  # Refresh GUI
+                redraw = True
 
             elif choice == "4":
                 # Show statistics
                 console.clear()
-                stats = blog_manager.get_statistics()
+                stats = get_manager().get_statistics()
                 display_stats_gui(stats)
                 Prompt.ask("[dim]Press Enter to return to GUI...[/dim]",
                            default="")
-                console.clear()
-                return display_blog_gui()  # Refresh GUI
+                redraw = True
 
             elif choice == "5":
-                # Refresh GUI
-                console.clear()
-                return display_blog_gui()
+                # Refresh GUI: re-read the posts from disk instead of
+                # reusing the cached listing and layout
+                get_manager().refresh()
+                _gui_layout_cache.clear()
+                redraw = True
 
             elif choice == "6":
                 # List all posts in table view
                 console.clear()
-                posts = blog_manager.list_posts(limit=50)
+                posts = get_manager().list_posts(limit=50)
 
                 if posts:
                     table = Table(title="All Blog Posts")
@@ -511,12 +553,13 @@ def display_blog_gui():
                     table.add_column("Tags", style="blue")
                     table.add_column("Created", style="yellow")
 
+                    now = datetime.now()
                     for post_id, post in posts:
                         tags_str = ", ".join(
                             post.tags) if post.tags else "None"
                         table.add_row(post_id, truncate_text(post.title, 30),
                                       post.author, truncate_text(tags_str, 20),
-                                      format_date(post.created_at))
+                                      format_date(post.created_at, now=now))
 
                     console.print(table)
                 else:
@@ -524,36 +567,118 @@ def display_blog_gui():
 
                 Prompt.ask("[dim]Press Enter to return to GUI...[/dim]",
                            default="")
-                console.clear()
-                return display_blog_gui()  # Refresh GUI
+                redraw = True
 
             elif choice == "7":
                 # Exit
                 console.print("[green]Goodbye![/green]")
-                break
+                return
 
         except KeyboardInterrupt:
             console.print("\n[green]Goodbye![/green]")
-            break
+            return
         except EOFError:
             console.print("\n[green]Goodbye![/green]")
-            break
+            return
         except Exception as e:
             console.print(f"[red]Error: {str(e)}[/red]")
             Prompt.ask("[dim]Press Enter to continue...[/dim]", default="")
 
 
+def draw_blog_gui():
+    """Draw the GUI layout and menu header, returning False if there are no posts"""
+    console.clear()
+
+    # Get post summaries, with a spinner only for as long as loading takes.
+    # The GUI only shows a preview of each post, so no content is read.
+    with console.status("[bold green]Loading your blog posts...",
+                        spinner="dots"):
+        posts = get_manager().list_post_summaries(limit=50)
+
+    if not posts:
+        console.print(
+            Panel(
+                "[yellow]No blog posts found. Create your first post with:[/yellow]\n[cyan]python main.py create[/cyan]",
+                title="🔍 Empty Blog",
+                border_style="yellow"))
+        return False
+
+    # Create header
+    header = Panel(
+        "[bold blue]🌟 Blog Management System - GUI Interface 🌟[/bold blue]\n" +
+        f"[dim]Total Posts: {len(posts)} | Press Ctrl+C to exit[/dim]",
+        border_style="blue")
+
+    console.print(header)
+    console.print()
+
+    # Reuse the last layout while the posts and terminal size are unchanged.
+    # The minute is part of the key so relative dates ("5 minutes ago") stay
+    # current.
+    key = (get_manager().data_version(), console.size,
+           datetime.now().replace(second=0, microsecond=0))
+    layout = _gui_layout_cache.get(key)
+    if layout is None:
+        layout = create_gui_layout(posts)
+        _gui_layout_cache.clear()
+        _gui_layout_cache[key] = layout
+
+    # Display the layout
+    console.print(layout)
+
+    # Interactive menu header
+    console.print("\n[bold green]🎛️  Interactive Menu:[/bold green]")
+    console.print("[dim]Press Ctrl+C to exit anytime[/dim]")
+
+    return True
+
+
+def create_gui_layout(posts):
+    """Build the GUI layout of header, post sidebar, recent posts and footer"""
+    # GUI-only renderables are imported on demand to keep CLI startup fast
+    from rich.layout import Layout
+
+    # Create layout
+    layout = Layout()
+    layout.split_column(Layout(name="header", size=3), Layout(name="body"),
+                        Layout(name="footer", size=3))
+
+    # Split body into sidebar and main content
+    layout["body"].split_row(Layout(name="sidebar", minimum_size=30),
+                             Layout(name="main", ratio=2))
+
+    # Create sidebar with post list
+    sidebar_content = create_sidebar_content(posts)
+    layout["sidebar"].update(sidebar_content)
+
+    # Create main content area
+    main_content = create_main_content(posts)
+    layout["main"].update(main_content)
+
+    # Create footer
+    footer_content = Panel(
+        "[bold cyan]Navigation:[/bold cyan] Use [yellow]'python main.py view <post-id>'[/yellow] to read full posts | "
+        + "[green]'python main.py create'[/green] to add new posts",
+        border_style="cyan")
+    layout["footer"].update(footer_content)
+
+    return layout
+
+
 def create_sidebar_content(posts):
     """Create sidebar content showing list of posts"""
+    from rich.tree import Tree
+
     tree = Tree("📚 [bold blue]Your Blog Posts[/bold blue]")
 
+    now = datetime.now()
     for post_id, post in posts[:10]:  # Show first 10 posts
         # Create a branch for each post
         post_branch = tree.add(f"[green]{post.title}[/green]")
         post_branch.add(f"[dim]ID:[/dim] [cyan]{post_id}[/cyan]")
         post_branch.add(f"[dim]Author:[/dim] [yellow]{post.author}[/yellow]")
         post_branch.add(
-            f"[dim]Created:[/dim] [magenta]{format_date(post.created_at)}[/magenta]"
+            f"[dim]Created:[/dim] [magenta]{format_date(post.created_at, now=now)}[/magenta]"
         )
 
         if post.tags:
@@ -568,6 +693,8 @@ def create_sidebar_content(posts):
 
 def create_main_content(posts):
     """Create main content area with recent posts"""
+    from rich.columns import Columns
+
     if not posts:
         return Panel("[yellow]No posts to display[/yellow]",
                      title="📝 Recent Posts",
@@ -577,16 +704,17 @@ def create_main_content(posts):
     recent_posts = posts[:3]
 
     content_panels = []
+    now = datetime.now()
     for post_id, post in recent_posts:
         tags_str = ", ".join(post.tags) if post.tags else "None"
 
         post_content = f"""
 [bold magenta]{post.title}[/bold magenta]
-[blue]By:[/blue] {post.author} | [blue]Created:[/blue] {format_date(post.created_at)}
+[blue]By:[/blue] {post.author} | [blue]Created:[/blue] {format_date(post.created_at, now=now)}
 [blue]Tags:[/blue] {tags_str}
 [blue]ID:[/blue] {post_id}
 
-[dim]{truncate_text(post.content, 200)}[/dim]
+[dim]{post.content_preview}[/dim]
         """
 
         content_panels.append(Panel(post_content, border_style="magenta"))
@@ -2,12 +2,18 @@
 Data models for the blog management system
 """
 
+import sys
 from datetime import datetime
-from typing import List, Optional
+from typing import List, NamedTuple, Optional
 from dataclasses import dataclass, field
 import json
 
-@dataclass
+try:
+    import orjson
+except ImportError:  # Optional speedup, fall back to the stdlib json module
+    orjson = None
+
+@dataclass(slots=True)
 class BlogPost:
     """Blog post data model"""
     title: str
@@ -17,8 +23,22 @@ class BlogPost:
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: Optional[datetime] = None
     
-    def to_dict(self) -> dict:
-        """Convert blog post to dictionary"""
+    def to_dict(self, serialize_dates: bool = True) -> dict:
+        """Convert blog post to dictionary
+        
+        With serialize_dates=False the datetimes are left for a JSON encoder
+        that handles them itself (orjson writes the same ISO 8601 in C).
+        """
+        if not serialize_dates:
+            return {
+                'title': self.title,
+                'content': self.content,
+                'author': self.author,
+                'tags': self.tags,
+                'created_at': self.created_at,
+                'updated_at': self.updated_at
+            }
+        
         return {
             'title': self.title,
             'content': self.content,
@@ -36,23 +56,29 @@ class BlogPost:
         if data.get('updated_at'):
             updated_at = datetime.fromisoformat(data['updated_at'])
         
+        # A blog has few distinct authors and tags, so every post shares one
+        # copy of each string
         return cls(
             title=data['title'],
             content=data['content'],
-            author=data.get('author', 'Anonymous'),
-            tags=data.get('tags', []),
+            author=sys.intern(data.get('author', 'Anonymous')),
+            tags=[sys.intern(tag) for tag in data.get('tags', [])],
             created_at=created_at,
             updated_at=updated_at
         )
     
     def to_json(self) -> str:
         """Convert blog post to JSON string"""
+        if orjson is not None:
+            return orjson.dumps(self.to_dict(serialize_dates=False),
+                                option=orjson.OPT_INDENT_2).decode('utf-8')
+        
         return json.dumps(self.to_dict(), indent=2, ensure_ascii=False)
     
     @classmethod
     def from_json(cls, json_str: str) -> 'BlogPost':
         """Create blog post from JSON string"""
-        data = json.loads(json_str)
+        data = orjson.loads(json_str) if orjson is not None else json.loads(json_str)
         return cls.from_dict(data)
     
     def __str__(self) -> str:
@@ -62,3 +88,31 @@ class BlogPost:
     def __repr__(self) -> str:
         """Detailed string representation"""
         return self.__str__()
+
+
+class PostSummary(NamedTuple):
+    """Lightweight view of a blog post's metadata, without its content"""
+    title: str
+    author: str
+    tags: List[str]
+    created_at: datetime
+    updated_at: Optional[datetime]
+    content_length: int
+    content_preview: str
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'PostSummary':
+        """Create post summary from an index entry"""
+        updated_at = None
+        if data.get('updated_at'):
+            updated_at = datetime.fromisoformat(data['updated_at'])
+        
+        return cls(
+            title=data['title'],
+            author=sys.intern(data.get('author', 'Anonymous')),
+            tags=[sys.intern(tag) for tag in data.get('tags', [])],
+            created_at=datetime.fromisoformat(data['created_at']),
+            updated_at=updated_at,
+            content_length=data['content_length'],
+            content_preview=data['content_preview']
+        )
@@ -4,19 +4,53 @@ Storage layer for blog posts using JSON files
 
 import os
 import json
-from typing import List, Tuple, Optional
+import atexit
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Tuple, Optional
 from datetime import datetime
 
-from models import BlogPost
+try:
+    import orjson
+except ImportError:  # Optional speedup, fall back to the stdlib json module
+    orjson = None
+
+from models import BlogPost, PostSummary
+from utils import truncate_text
+
+# Length of the content preview kept in each index entry
+PREVIEW_LENGTH = 200
+
+# Permissions open() would give a new file; mkstemp creates them 0600.
+# os.umask can only be read by setting it, so that is done once, at import.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_NEW_FILE_MODE = 0o666 & ~_UMASK
 
 class JSONStorage:
     """JSON-based storage for blog posts"""
     
+    # Index changes are written out after this many saves/deletes (and at exit)
+    index_flush_interval = 64
+    
+    # Threads used to read post files; set to 1 on spinning disks, where
+    # parallel reads only add seeks
+    load_workers = 32
+    
     def __init__(self, data_dir: str = "./blog_data"):
         self.data_dir = data_dir
         self.posts_dir = os.path.join(data_dir, "posts")
         self.index_file = os.path.join(data_dir, "index.json")
+        
+        # In-memory copy of the index, re-read only when the file changes
+        self._index_cache: Optional[dict] = None
+        self._index_mtime: Optional[int] = None
+        
+        # Entries changed here but not yet written (None marks a removal)
+        self._index_changes: Dict[str, Optional[dict]] = {}
+        
         self._ensure_directories()
+        atexit.register(self.flush_index)
     
     def _ensure_directories(self):
         """Ensure storage directories exist"""
@@ -26,12 +60,11 @@ class JSONStorage:
         """Save a blog post to storage"""
         try:
             # Save post data
-            post_file = os.path.join(self.posts_dir, f"{post_id}.json")
-            with open(post_file, 'w', encoding='utf-8') as f:
-                json.dump(post.to_dict(), f, indent=2, ensure_ascii=False)
+            post_file = self.raw_path(post_id)
+            _write_json(post_file, post.to_dict(serialize_dates=False))
             
             # Update index
-            self._update_index(post_id, post)
+            self._update_index(post_id, post, os.stat(post_file).st_mtime_ns)
             return True
             
         except Exception as e:
@@ -41,12 +74,11 @@ class JSONStorage:
     def load_post(self, post_id: str) -> Optional[BlogPost]:
         """Load a blog post from storage"""
         try:
-            post_file = os.path.join(self.posts_dir, f"{post_id}.json")
+            post_file = self.raw_path(post_id)
             if not os.path.exists(post_file):
                 return None
             
-            with open(post_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _read_json(post_file)
             
             return BlogPost.from_dict(data)
             
@@ -57,7 +89,7 @@ class JSONStorage:
     def delete_post(self, post_id: str) -> bool:
         """Delete a blog post from storage"""
         try:
-            post_file = os.path.join(self.posts_dir, f"{post_id}.json")
+            post_file = self.raw_path(post_id)
             if os.path.exists(post_file):
                 os.remove(post_file)
             
@@ -71,70 +103,231 @@ class JSONStorage:
     
     def post_exists(self, post_id: str) -> bool:
         """Check if a post exists in storage"""
-        post_file = os.path.join(self.posts_dir, f"{post_id}.json")
+        post_file = self.raw_path(post_id)
         return os.path.exists(post_file)
     
-    def load_all_posts(self) -> List[Tuple[str, BlogPost]]:
-        """Load all blog posts from storage"""
-        posts = []
-        
+    def raw_path(self, post_id: str) -> str:
+        """Get the path of a post's JSON file (same layout as a JSON export)"""
+        return os.path.join(self.posts_dir, f"{post_id}.json")
+    
+    def load_all_posts(self) -> Iterator[Tuple[str, BlogPost]]:
+        """Lazily load all blog posts from storage"""
         try:
             # Get all post files
-            for filename in os.listdir(self.posts_dir):
-                if filename.endswith('.json'):
-                    post_id = filename[:-5]  # Remove .json extension
-                    post = self.load_post(post_id)
-                    if post:
-                        posts.append((post_id, post))
+            with os.scandir(self.posts_dir) as entries:
+                post_ids = [entry.name[:-5] for entry in entries if entry.name.endswith('.json')]
         except Exception as e:
             print(f"Error loading posts: {e}")
+            return
         
-        return posts
+        yield from self.load_posts(post_ids)
     
-    def _update_index(self, post_id: str, post: BlogPost):
-        """Update the posts index file"""
+    def load_posts(self, post_ids: List[str]) -> Iterator[Tuple[str, BlogPost]]:
+        """Load several blog posts, reading their files in parallel"""
+        max_workers = min(self.load_workers, len(post_ids))
+        if max_workers <= 1:
+            for post_id in post_ids:
+                post = self.load_post(post_id)
+                if post:
+                    yield post_id, post
+            return
+        
+        # File reads release the GIL, so threads overlap the I/O latency
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for post_id, post in zip(post_ids, executor.map(self.load_post, post_ids)):
+                if post:
+                    yield post_id, post
+    
+    def load_all_posts_list(self) -> List[Tuple[str, BlogPost]]:
+        """Load all blog posts from storage into a list"""
+        return list(self.load_all_posts())
+    
+    def iter_post_headers(self) -> Iterator[Tuple[str, dict]]:
+        """Lazily yield each post's index entry (its metadata, without content)"""
         try:
             index = self._load_index()
+            with os.scandir(self.posts_dir) as entries:
+                files = [(entry.name[:-5], entry.stat().st_mtime_ns)
+                         for entry in entries if entry.name.endswith('.json')]
+        except Exception as e:
+            print(f"Error loading post headers: {e}")
+            return
+        
+        backfilled = False
+        for post_id, mtime_ns in files:
+            entry = index.get(post_id)
+            if entry is None or entry.get('mtime_ns') != mtime_ns:
+                # Post added or edited outside the app, or indexed by an older version
+                post = self.load_post(post_id)
+                if not post:
+                    continue
+                entry = index[post_id] = self._index_changes[post_id] = self._index_entry(post, mtime_ns)
+                backfilled = True
             
-            index[post_id] = {
-                'title': post.title,
-                'author': post.author,
-                'tags': post.tags,
-                'created_at': post.created_at.isoformat(),
-                'updated_at': post.updated_at.isoformat() if post.updated_at else None
-            }
-            
-            with open(self.index_file, 'w', encoding='utf-8') as f:
-                json.dump(index, f, indent=2, ensure_ascii=False)
+            yield post_id, entry
+        
+        if backfilled:
+            self.flush_index()
+    
+    def load_all_summaries(self) -> List[Tuple[str, PostSummary]]:
+        """Load summaries of all blog posts from the index, without reading their content"""
+        summaries = []
+        
+        try:
+            for post_id, header in self.iter_post_headers():
+                summaries.append((post_id, PostSummary.from_dict(header)))
+        except Exception as e:
+            print(f"Error loading post summaries: {e}")
+        
+        return summaries
+    
+    def _update_index(self, post_id: str, post: BlogPost, mtime_ns: int):
+        """Update the posts index file"""
+        try:
+            index = self._load_index()
+            index[post_id] = self._index_changes[post_id] = self._index_entry(post, mtime_ns)
+            self._maybe_flush_index()
                 
         except Exception as e:
             print(f"Error updating index: {e}")
     
+    def _index_entry(self, post: BlogPost, mtime_ns: int) -> dict:
+        """Build the index entry (post metadata without content) for a post file"""
+        return {
+            'title': post.title,
+            'author': post.author,
+            'tags': post.tags,
+            'created_at': post.created_at.isoformat(),
+            'updated_at': post.updated_at.isoformat() if post.updated_at else None,
+            'content_length': len(post.content),
+            'content_preview': truncate_text(post.content, PREVIEW_LENGTH),
+            'mtime_ns': mtime_ns
+        }
+    
     def _remove_from_index(self, post_id: str):
         """Remove a post from the index file"""
         try:
             index = self._load_index()
-            
-            if post_id in index:
-                del index[post_id]
-                
-                with open(self.index_file, 'w', encoding='utf-8') as f:
-                    json.dump(index, f, indent=2, ensure_ascii=False)
+            index.pop(post_id, None)
+            self._index_changes[post_id] = None
+            self._maybe_flush_index()
                     
         except Exception as e:
             print(f"Error removing from index: {e}")
     
+    def _maybe_flush_index(self):
+        """Write pending index changes once enough of them have built up"""
+        if len(self._index_changes) >= self.index_flush_interval:
+            self.flush_index()
+    
+    def flush_index(self):
+        """Write pending index changes to the index file"""
+        if not self._index_changes or not os.path.isdir(self.data_dir):
+            # Nothing to write, or the whole data directory has been removed
+            return
+        
+        try:
+            # Merge into the file as it is now, so entries another process
+            # wrote since this one last read it are kept
+            mtime = self.index_mtime()
+            index = self._read_index_file(mtime)
+            self._apply_index_changes(index)
+            self._write_index(index)
+        except Exception as e:
+            print(f"Error writing index: {e}")
+    
+    def _write_index(self, index: dict):
+        """Write the posts index file"""
+        _write_json(self.index_file, index)
+        
+        self._index_cache = index
+        self._index_mtime = os.stat(self.index_file).st_mtime_ns
+        self._index_changes = {}
+    
     def _load_index(self) -> dict:
-        """Load the posts index file"""
+        """Load the posts index, re-reading the file only if it changed on disk"""
+        mtime = self.index_mtime()
+        if self._index_cache is None or mtime != self._index_mtime:
+            index = self._read_index_file(mtime)
+            
+            # Unwritten changes made here are newer than the file
+            self._apply_index_changes(index)
+            
+            self._index_cache = index
+            self._index_mtime = mtime
+        
+        return self._index_cache
+    
+    def _read_index_file(self, mtime: Optional[int]) -> dict:
+        """Read the index file, given its current mtime (None if it doesn't exist)"""
+        if mtime is None:
+            return {}
+        
         try:
-            if os.path.exists(self.index_file):
-                with open(self.index_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+            return _read_json(self.index_file)
         except Exception as e:
             print(f"Error loading index: {e}")
-        
-        return {}
+            return {}
+    
+    def _apply_index_changes(self, index: dict):
+        """Apply the pending entry changes and removals to an index dict"""
+        for post_id, entry in self._index_changes.items():
+            if entry is None:
+                index.pop(post_id, None)
+            else:
+                index[post_id] = entry
+    
+    def index_mtime(self) -> Optional[int]:
+        """Get the index file's modification time in ns, or None if it doesn't exist"""
+        try:
+            return os.stat(self.index_file).st_mtime_ns
+        except OSError:
+            return None
+    
+    def posts_mtime(self) -> Optional[int]:
+        """Get the posts directory's modification time in ns, or None if it doesn't exist"""
+        try:
+            return os.stat(self.posts_dir).st_mtime_ns
+        except OSError:
+            return None
     
     def get_index(self) -> dict:
         """Get the current posts index"""
-        return self._load_index()
+        return dict(self._load_index())
+
+
+def _read_json(path: str):
+    """Read and parse a JSON file"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_json(path: str, data):
+    """Write data to a JSON file, indented with 2 spaces and UTF-8 encoded
+    
+    Datetimes are written as ISO 8601 strings. The file is written under a
+    temporary name and then renamed over path, so a crash mid-write never
+    leaves a truncated file behind. Each write gets its own temporary file,
+    so processes saving the same file at once never write into each other's.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.',
+                                    prefix=f"{os.path.basename(path)}.", suffix='.tmp')
+    try:
+        if orjson is not None:
+            # Same bytes as the json.dump call below, encoded in C
+            with open(fd, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False, default=datetime.isoformat)
+        
+        os.chmod(tmp_path, _NEW_FILE_MODE)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise